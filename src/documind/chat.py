@@ -2,6 +2,9 @@
 
 from __future__ import annotations
 
+import shutil
+import threading
+from collections import deque
 from pathlib import Path
 
 from rich.console import Console
@@ -11,6 +14,7 @@ from rich.panel import Panel
 from rich.prompt import Prompt
 
 from .config import Config
+from .embeddings import warm_up
 from .index import DocuMindIndex
 from .llm import LLMError, OllamaClient
 from .ollama_daemon import ensure_daemon_running, install_hint
@@ -37,8 +41,6 @@ def run_chat(project_root: Path, cfg: Config) -> None:
         )
         return
 
-    import shutil
-
     if shutil.which("ollama") is None:
         console.print(
             f"[yellow]Ollama isn't installed.[/yellow] Install with:\n"
@@ -65,7 +67,13 @@ def run_chat(project_root: Path, cfg: Config) -> None:
         )
         return
 
-    history: list[dict] = []
+    # Load the embedding model while the user types their first question,
+    # instead of adding its cold-start to the first answer's latency.
+    threading.Thread(target=warm_up, args=(cfg,), daemon=True).start()
+
+    # Rolling follow-up memory: deque evicts the oldest turn on append, so
+    # trimming is O(1) instead of re-slicing the list after every exchange.
+    history: deque[dict] = deque(maxlen=8)
     session_model = cfg.model
     session_k = cfg.top_k
 
@@ -98,6 +106,8 @@ def run_chat(project_root: Path, cfg: Config) -> None:
                 continue
             if cmd == "clear":
                 history.clear()
+                # Rich clears via ANSI escapes; no shelling out to clear/cls.
+                console.clear()
                 console.print("[yellow]History cleared.[/yellow]")
                 continue
             if cmd == "k" and len(parts) == 2 and parts[1].isdigit():
@@ -119,7 +129,7 @@ def run_chat(project_root: Path, cfg: Config) -> None:
         context = hits_to_context(hits)
         messages = build_messages(user, context)
         # Keep a short rolling history for follow-ups
-        messages = history + messages
+        messages = list(history) + messages
         buffer = ""
         console.print("[bold green]documind[/bold green]")
         try:
@@ -134,8 +144,6 @@ def run_chat(project_root: Path, cfg: Config) -> None:
         # Light summarized memory: append last exchange
         history.append({"role": "user", "content": user})
         history.append({"role": "assistant", "content": buffer})
-        if len(history) > 8:
-            history = history[-8:]
 
         # Footer: show which files were used
         refs = ", ".join(
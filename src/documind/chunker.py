@@ -10,8 +10,12 @@ from __future__ import annotations
 
 import fnmatch
 import hashlib
+import io
 import os
+import re
+from bisect import bisect_right
 from collections.abc import Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
 
@@ -43,7 +47,7 @@ LANG_BY_EXT: dict[str, str] = {
 }
 
 
-@dataclass
+@dataclass(slots=True)
 class FileRecord:
     """Metadata for a single source file picked up by the walker."""
 
@@ -51,11 +55,16 @@ class FileRecord:
     rel_path: str      # path relative to project root (POSIX)
     size: int
     mtime: float
-    file_hash: str     # sha1 of content
+    file_hash: str     # blake2b-160 of content
     language: str
+    # Decoded content, carried over from the scan's hashing read so chunking
+    # doesn't read the file a second time. None for PDFs and for records
+    # built without a read (mtime/size fast path); consumers should clear it
+    # once chunked to release the memory.
+    text: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class Chunk:
     """A chunk produced from a file, ready for embedding + indexing."""
 
@@ -68,8 +77,10 @@ class Chunk:
     file_hash: str
 
 
-def _sha1_bytes(data: bytes) -> str:
-    return hashlib.sha1(data, usedforsecurity=False).hexdigest()
+def _hash_bytes(data: bytes) -> str:
+    # BLAKE2b is noticeably faster than SHA-1 for this non-cryptographic use;
+    # 20 bytes keeps the hex ids the same width as before.
+    return hashlib.blake2b(data, digest_size=20).hexdigest()
 
 
 def _detect_language(path: Path) -> str:
@@ -81,48 +92,168 @@ def _detect_language(path: Path) -> str:
     return LANG_BY_EXT.get(path.suffix.lower(), "text")
 
 
-def _should_include(path: Path) -> bool:
-    if path.suffix.lower() in SUPPORTED_EXTENSIONS:
-        return True
-    lname = path.name.lower()
-    return lname in {"dockerfile", "makefile", "gnumakefile"}
+# Extensionless filenames that are still indexable source files.
+_SPECIAL_NAMES = frozenset({"dockerfile", "makefile", "gnumakefile"})
+
+# Single include table: probed with the lowered extension when there is one,
+# else the whole lowered filename -- one frozenset lookup either way.
+_INCLUDE_KEYS = SUPPORTED_EXTENSIONS | _SPECIAL_NAMES
+
+
+# The walker rejects every dotted name before consulting IGNORE_DIRS, so the
+# dotted members (.git, .venv, ...) can be dropped from the hot probe set.
+_IGNORE_DIR_NAMES = frozenset(d for d in IGNORE_DIRS if not d.startswith("."))
+
+# IGNORE_FILE_GLOBS split at import: plain "*.suffix" patterns (all of them
+# today) collapse into a single C-level str.endswith probe; any pattern with
+# real glob metacharacters falls back to one compiled alternation.
+_IGNORE_SUFFIXES = tuple(
+    p[1:] for p in IGNORE_FILE_GLOBS
+    if p.startswith("*") and not any(ch in p[1:] for ch in "*?[")
+)
+_complex_globs = [
+    p for p in IGNORE_FILE_GLOBS
+    if not (p.startswith("*") and not any(ch in p[1:] for ch in "*?["))
+]
+_IGNORE_GLOB_RE = (
+    re.compile("|".join(fnmatch.translate(p) for p in _complex_globs))
+    if _complex_globs
+    else None
+)
+
+
+def _gitignore_names(root: Path) -> frozenset[str]:
+    """Collect simple whole-name patterns from the project's root .gitignore.
+
+    Only bare names with no glob metacharacters or path separators are
+    honored (e.g. ``build/``, ``datasets``) -- the common case of repos
+    excluding a couple of big generated directories. Anchored paths,
+    wildcards, and negations are skipped rather than half-implemented, and
+    dotted names are already pruned by the walker.
+    """
+    try:
+        lines = (root / ".gitignore").read_text(encoding="utf-8").splitlines()
+    except OSError:
+        return frozenset()
+    names: set[str] = set()
+    for line in lines:
+        line = line.strip().rstrip("/")
+        if not line or line[0] in "#!." or any(ch in line for ch in "*?[/\\"):
+            continue
+        names.add(line)
+    return frozenset(names)
 
 
 def _is_ignored_filename(name: str) -> bool:
     """Return True if `name` matches the IGNORE_FILES set or any glob pattern."""
     if name in IGNORE_FILES:
         return True
-    return any(fnmatch.fnmatch(name, pattern) for pattern in IGNORE_FILE_GLOBS)
+    if _IGNORE_SUFFIXES and name.endswith(_IGNORE_SUFFIXES):
+        return True
+    return _IGNORE_GLOB_RE is not None and _IGNORE_GLOB_RE.match(name) is not None
+
+
+def _iter_source_entries(
+    root: Path,
+    max_bytes: int,
+    extra_ignore_dirs: Iterable[str] = (),
+) -> Iterator[tuple[str, os.stat_result]]:
+    """Yield (path, stat) for candidate source files under `root`.
+
+    Uses an explicit `os.scandir` stack instead of `os.walk`: ignored
+    directories are pruned before recursion, and each `DirEntry` carries
+    cached type/stat info, so excluded subtrees (node_modules, .git, venv,
+    build output, ...) cost zero extra syscalls. The stat the size check
+    already needed is yielded alongside the path so callers don't stat the
+    same file a second time. `extra_ignore_dirs` lets callers prune
+    additional names (e.g. a non-dotted `index_dir_name`); they are folded
+    into the one frozenset probed per directory. `root` must already be
+    resolved -- callers do that once instead of per traversal.
+    """
+    ignore_dirs = _IGNORE_DIR_NAMES
+    extra = (
+        frozenset(d for d in extra_ignore_dirs if not d.startswith("."))
+        | _gitignore_names(root)
+    )
+    if extra:
+        ignore_dirs = ignore_dirs | extra
+    stack = [str(root)]
+    push = stack.append  # bound once; appends happen per accepted directory
+    while stack:
+        try:
+            it = os.scandir(stack.pop())
+        except OSError:
+            continue
+        with it:
+            for entry in it:
+                name = entry.name
+                # scandir never yields empty names; slicing beats a
+                # startswith method call in this per-entry loop.
+                if name[0] == ".":
+                    continue
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        if name not in ignore_dirs:
+                            push(entry.path)
+                        continue
+                    if not entry.is_file(follow_symlinks=False):
+                        continue
+                except OSError:
+                    continue
+                # One lowercase + one rfind per candidate, on plain strings;
+                # a Path is only built for files we keep. rfind extracts the
+                # suffix without splitext's tuple + stem allocations (dotted
+                # names were already skipped, so dot > 0 means a real
+                # suffix). The frozenset probe runs before the ignore globs.
+                lname = name.lower()
+                dot = lname.rfind(".")
+                if (lname[dot:] if dot > 0 else lname) not in _INCLUDE_KEYS:
+                    continue
+                if _is_ignored_filename(name):
+                    continue
+                # Bare .gitignore names match files as well as directories.
+                if name in extra:
+                    continue
+                try:
+                    st = entry.stat(follow_symlinks=False)
+                except OSError:
+                    continue
+                if st.st_size > max_bytes:
+                    continue
+                yield entry.path, st
 
 
-def iter_source_files(root: Path, max_bytes: int) -> Iterator[Path]:
+def iter_source_files(
+    root: Path,
+    max_bytes: int,
+    extra_ignore_dirs: Iterable[str] = (),
+) -> Iterator[Path]:
     """Yield candidate source files under `root`, honoring ignore rules."""
-    root = root.resolve()
-    for dirpath, dirnames, filenames in os.walk(root):
-        dirnames[:] = [d for d in dirnames if d not in IGNORE_DIRS and not d.startswith(".")]
-        for fname in filenames:
-            if fname.startswith("."):
-                continue
-            if _is_ignored_filename(fname):
-                continue
-            p = Path(dirpath) / fname
-            if not _should_include(p):
-                continue
-            try:
-                if p.stat().st_size > max_bytes:
-                    continue
-            except OSError:
-                continue
-            yield p
+    for path, _st in _iter_source_entries(root.resolve(), max_bytes, extra_ignore_dirs):
+        yield Path(path)
+
+
+# pypdf import result memoized across PDFs: the class on success, False when
+# the optional dependency is missing (so we don't retry the import per file).
+_pdf_reader_cls: type | bool | None = None
 
 
 def _read_pdf(path: Path) -> str:
-    try:
-        from pypdf import PdfReader
-    except ImportError:
+    global _pdf_reader_cls
+    if _pdf_reader_cls is None:
+        try:
+            from pypdf import PdfReader
+
+            _pdf_reader_cls = PdfReader
+        except ImportError:
+            _pdf_reader_cls = False
+    if _pdf_reader_cls is False:
         return ""
+    reader_cls = _pdf_reader_cls
     try:
-        reader = PdfReader(str(path))
+        # pypdf seeks all over the file while resolving objects; one bulk
+        # read into memory is much cheaper than that syscall chatter.
+        reader = reader_cls(io.BytesIO(path.read_bytes()))
         pages = []
         for page in reader.pages:
             try:
@@ -134,13 +265,8 @@ def _read_pdf(path: Path) -> str:
         return ""
 
 
-def _read_text(path: Path) -> str:
-    if path.suffix.lower() == ".pdf":
-        return _read_pdf(path)
-    try:
-        data = path.read_bytes()
-    except OSError:
-        return ""
+def _decode_bytes(data: bytes) -> str:
+    """Decode file bytes to text; empty string for binary/undecodable data."""
     if b"\x00" in data[:4096]:
         return ""
     for enc in ("utf-8", "utf-16", "latin-1"):
@@ -151,27 +277,95 @@ def _read_text(path: Path) -> str:
     return ""
 
 
-def scan_files(root: Path, cfg: Config) -> list[FileRecord]:
-    """Walk the project and return FileRecord metadata (no text loaded yet)."""
-    records: list[FileRecord] = []
+def _read_text(path: Path, language: str | None = None) -> str:
+    # Callers holding a FileRecord already classified the file at scan time;
+    # only sniff the suffix again when no language is passed.
+    if language == "pdf" or (language is None and path.suffix.lower() == ".pdf"):
+        return _read_pdf(path)
+    # Sniff the head before committing to a full read: binary files are
+    # rejected after 4 KB instead of being loaded wholesale.
+    try:
+        with path.open("rb") as f:
+            head = f.read(4096)
+            if b"\x00" in head:
+                return ""
+            data = head + f.read()
+    except OSError:
+        return ""
+    return _decode_bytes(data)
+
+
+def _build_record(path: Path, root: Path, stat: os.stat_result | None = None) -> FileRecord | None:
+    """Read and hash a single file; None if it vanished mid-scan.
+
+    `stat` is the walker's cached result when available, so the common path
+    costs one read and zero extra stat syscalls.
+    """
+    try:
+        if stat is None:
+            stat = path.stat()
+        data = path.read_bytes()
+    except OSError:
+        return None
+    language = _detect_language(path)
+    return FileRecord(
+        path=path.as_posix(),
+        rel_path=path.relative_to(root).as_posix(),
+        size=stat.st_size,
+        mtime=stat.st_mtime,
+        file_hash=_hash_bytes(data),
+        language=language,
+        # The bytes are already in hand for hashing; decode now so chunking
+        # doesn't have to read the file again. PDFs need pypdf, not a decode.
+        text=_decode_bytes(data) if language != "pdf" else None,
+    )
+
+
+def scan_files(
+    root: Path,
+    cfg: Config,
+    known: dict[str, tuple[str, float, int]] | None = None,
+) -> list[FileRecord]:
+    """Walk the project and return FileRecord metadata (no text loaded yet).
+
+    `known` maps rel_path -> (file_hash, mtime, size) from the previous
+    index pass. A file whose mtime and size both match is trusted unchanged
+    (the same bargain make and git strike) and reuses its stored hash, so
+    incremental scans of a quiet tree read no file contents at all. The
+    rest are read + hashed by a thread pool; results keep walk order.
+    """
     root = root.resolve()
-    for p in iter_source_files(root, cfg.max_file_bytes):
-        try:
-            stat = p.stat()
-            data = p.read_bytes()
-        except OSError:
-            continue
-        records.append(
-            FileRecord(
-                path=p.as_posix(),
-                rel_path=p.relative_to(root).as_posix(),
-                size=stat.st_size,
-                mtime=stat.st_mtime,
-                file_hash=_sha1_bytes(data),
-                language=_detect_language(p),
+    entries = list(_iter_source_entries(root, cfg.max_file_bytes, (cfg.index_dir_name,)))
+    if not entries:
+        return []
+
+    prefix_len = len(str(root)) + 1
+    results: list[FileRecord | None] = [None] * len(entries)
+    slow: list[int] = []
+    for i, (p, st) in enumerate(entries):
+        rel = p[prefix_len:]
+        if os.sep != "/":
+            rel = rel.replace(os.sep, "/")
+        prev = known.get(rel) if known else None
+        if prev is not None and prev[1] == st.st_mtime and prev[2] == st.st_size:
+            results[i] = FileRecord(
+                path=Path(p).as_posix(),
+                rel_path=rel,
+                size=st.st_size,
+                mtime=st.st_mtime,
+                file_hash=prev[0],
+                language=_detect_language(Path(p)),
             )
-        )
-    return records
+        else:
+            slow.append(i)
+
+    if slow:
+        workers = min(32, (os.cpu_count() or 1) * 4)
+        with ThreadPoolExecutor(max_workers=workers) as ex:
+            built = ex.map(lambda i: _build_record(Path(entries[i][0]), root, entries[i][1]), slow)
+            for i, rec in zip(slow, built, strict=True):
+                results[i] = rec
+    return [rec for rec in results if rec]
 
 
 def _split_lines_into_chunks(
@@ -185,34 +379,40 @@ def _split_lines_into_chunks(
     """
     if not text:
         return []
-    lines = text.splitlines(keepends=True)
     chunks: list[tuple[int, int, str]] = []
 
+    # prefix[k] = offset of line k's start; chunk boundaries then become
+    # bisects into this array instead of per-line counting loops. The
+    # offsets come from a str.find scan (memchr under the hood) -- no
+    # per-line string objects are ever materialized. Lines are
+    # newline-delimited, matching editor and traceback numbering.
+    prefix = [0]
+    pos = text.find("\n")
+    while pos != -1:
+        prefix.append(pos + 1)
+        pos = text.find("\n", pos + 1)
+    if prefix[-1] < len(text):
+        prefix.append(len(text))
+
     i = 0
-    n = len(lines)
+    n = len(prefix) - 1
     while i < n:
-        cur_len = 0
-        j = i
-        while j < n and cur_len + len(lines[j]) <= chunk_size:
-            cur_len += len(lines[j])
-            j += 1
-        if j == i:
+        # Largest j with len(lines[i:j]) <= chunk_size, but at least one line.
+        j = bisect_right(prefix, prefix[i] + chunk_size) - 1
+        if j <= i:
             j = i + 1
         start_line = i + 1
         end_line = j
-        chunk_text = "".join(lines[i:j]).strip("\n")
+        chunk_text = text[prefix[i]:prefix[j]].strip("\n")
         if chunk_text.strip():
             chunks.append((start_line, end_line, chunk_text))
 
         if j >= n:
             break
 
-        # Step back by `chunk_overlap` worth of characters (line-aligned)
-        back = 0
-        k = j
-        while k > i and back < chunk_overlap:
-            k -= 1
-            back += len(lines[k])
+        # Step back by `chunk_overlap` worth of characters (line-aligned):
+        # largest k with len(lines[k:j]) >= chunk_overlap, clamped forward.
+        k = bisect_right(prefix, prefix[j] - chunk_overlap) - 1
         i = max(k, i + 1)
 
     return chunks
@@ -220,7 +420,9 @@ def _split_lines_into_chunks(
 
 def chunks_for_file(record: FileRecord, cfg: Config) -> list[Chunk]:
     """Read a file and split it into chunks carrying metadata."""
-    text = _read_text(Path(record.path))
+    text = record.text
+    if text is None:
+        text = _read_text(Path(record.path), language=record.language)
     if not text:
         return []
 
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import shutil
 import sys
 from pathlib import Path
 
@@ -37,6 +38,12 @@ app = typer.Typer(
 )
 console = Console()
 
+_PROGRESS_LABELS = {
+    "chunking": "Chunking",
+    "embedding": "Embedding",
+    "bm25": "BM25",
+}
+
 
 # --------------------------------------------------------------------- shared
 
@@ -62,11 +69,7 @@ def _build_index_with_progress(idx: DocuMindIndex):
         tasks: dict[str, int] = {}
 
         def on_progress(phase: str, done: int, total: int) -> None:
-            label = {
-                "chunking": "Chunking",
-                "embedding": "Embedding",
-                "bm25": "BM25",
-            }.get(phase, phase)
+            label = _PROGRESS_LABELS.get(phase, phase)
             if phase not in tasks:
                 tasks[phase] = progress.add_task(label, total=max(total, 1))
             progress.update(tasks[phase], completed=done, total=max(total, 1))
@@ -139,8 +142,6 @@ def _ensure_llm_ready(cfg: Config) -> OllamaClient | None:
     clear user-facing message). Never asks the user to open a second
     terminal -- we try to start Ollama ourselves first.
     """
-    import shutil
-
     if shutil.which("ollama") is None:
         console.print(
             f"[yellow]Ollama isn't installed.[/yellow] Install it with:\n"
@@ -221,6 +222,7 @@ def cmd_index(
     table.add_row("New",            f"[green]{stats.new_files}[/green]")
     table.add_row("Changed",        f"[yellow]{stats.changed_files}[/yellow]")
     table.add_row("Unchanged",      str(stats.unchanged_files))
+    table.add_row("Moved",          str(stats.moved_files))
     table.add_row("Removed",        f"[red]{stats.removed_files}[/red]")
     table.add_row("Embedded chunks", str(stats.embedded_chunks))
     table.add_row("Total chunks",   str(stats.total_chunks))
@@ -519,7 +521,7 @@ def cmd_doctor(
     # Index
     idx = DocuMindIndex(root, cfg)
     if idx.exists():
-        chunks = len(idx.all_chunks())
+        chunks = idx.chunk_count()
         table.add_row("index", "[green]ok[/green]", f"{chunks} chunks at {idx.index_dir}")
     else:
         table.add_row("index", "[yellow]none[/yellow]", f"Run: documind index {root}")
@@ -99,6 +99,8 @@ class Config:
     # Embedding model (fastembed ONNX, no torch required)
     embedding_model: str = "BAAI/bge-small-en-v1.5"
     embedding_dim: int = 384
+    embed_batch_size: int = 256  # texts per ONNX forward pass
+    embedding_threads: int | None = None  # ONNX Runtime threads (None = ORT default)
 
     # Retrieval / fusion
     top_k: int = 8
@@ -122,19 +124,31 @@ class Config:
         return asdict(self)
 
 
+# Parsed-TOML cache keyed by mtime so repeated load_config() calls within one
+# process (CLI helpers, index_dir_for, ...) don't re-read and re-parse the file.
+_toml_cache: dict[Path, tuple[float, dict]] = {}
+
+
 def _load_toml(path: Path) -> dict:
-    if not path.exists():
+    try:
+        mtime = path.stat().st_mtime
+    except OSError:
         return {}
+    cached = _toml_cache.get(path)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
     try:
         with path.open("rb") as f:
-            return tomllib.load(f)
+            data = tomllib.load(f)
     except Exception:
-        return {}
+        data = {}
+    _toml_cache[path] = (mtime, data)
+    return data
 
 
 def load_config(overrides: dict | None = None) -> Config:
     """Load config with precedence: defaults < file < explicit overrides."""
-    data = _load_toml(_config_path())
+    data = dict(_load_toml(_config_path()))
     if overrides:
         data.update({k: v for k, v in overrides.items() if v is not None})
 
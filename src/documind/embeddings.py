@@ -6,8 +6,11 @@ The underlying model is downloaded and cached by fastembed itself on first use.
 
 from __future__ import annotations
 
+import contextlib
+import threading
 from collections.abc import Iterable
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from functools import lru_cache
 
 import numpy as np
 
@@ -18,13 +21,20 @@ from .config import Config
 class _EmbedderState:
     model_name: str | None = None
     model: object | None = None  # fastembed.TextEmbedding instance
+    lock: threading.Lock = field(default_factory=threading.Lock)
 
 
 _state = _EmbedderState()
 
 
-def _get_model(model_name: str):
-    """Lazy-load the fastembed TextEmbedding model (cached per process)."""
+def _get_model(model_name: str, threads: int | None = None):
+    """Lazy-load the fastembed TextEmbedding model (cached per process).
+
+    Guarded by a lock so concurrent callers (e.g. search running BM25 and
+    vector retrieval side by side) never load the ~90 MB model twice.
+    `threads` caps ONNX Runtime's intra-op pool; it only applies on first
+    load since the session is cached for the life of the process.
+    """
     if _state.model is not None and _state.model_name == model_name:
         return _state.model
 
@@ -35,36 +45,85 @@ def _get_model(model_name: str):
             "fastembed is required. Install with: pip install fastembed"
         ) from exc
 
-    _state.model = TextEmbedding(model_name=model_name)
-    _state.model_name = model_name
+    with _state.lock:
+        if _state.model is None or _state.model_name != model_name:
+            # Release the old session before loading the new one so a model
+            # swap never holds two ONNX runtimes in memory at once.
+            _state.model = None
+            _state.model = TextEmbedding(model_name=model_name, threads=threads)
+            _state.model_name = model_name
     return _state.model
 
 
+def warm_up(cfg: Config) -> None:
+    """Load the embedding model ahead of first use.
+
+    Meant to run on a background thread (e.g. while a chat user types their
+    first question); errors are left for the first real embed call to surface.
+    """
+    with contextlib.suppress(Exception):
+        _get_model(cfg.embedding_model, cfg.embedding_threads)
+
+
 def embed_texts(
     texts: Iterable[str],
     cfg: Config,
-    batch_size: int = 64,
+    batch_size: int | None = None,
 ) -> np.ndarray:
     """Embed an iterable of texts and return an (N, dim) float32 ndarray.
 
-    Vectors are L2-normalized so cosine similarity == dot product.
+    Vectors are L2-normalized so cosine similarity == dot product. Larger
+    batches amortize per-call tokenizer and ONNX session overhead; the
+    default comes from `cfg.embed_batch_size`.
     """
     texts = [t if t else " " for t in texts]
     if not texts:
         return np.zeros((0, cfg.embedding_dim), dtype=np.float32)
 
-    model = _get_model(cfg.embedding_model)
-    vectors = list(model.embed(texts, batch_size=batch_size))
-    arr = np.asarray(vectors, dtype=np.float32)
-    norms = np.linalg.norm(arr, axis=1, keepdims=True)
+    model = _get_model(cfg.embedding_model, cfg.embedding_threads)
+    # Smart batching: encode in ascending-length order so each ONNX batch
+    # pads to its own max instead of the corpus max, then scatter the rows
+    # back to input order. Ordering doesn't affect the vectors themselves.
+    order = sorted(range(len(texts)), key=lambda i: len(texts[i]))
+    # For big corpora let fastembed shard the work across worker processes
+    # (parallel=0 == one per core). Workers re-load the ONNX model, so this
+    # only pays for itself on genuinely large batches.
+    parallel = 0 if len(texts) >= 1024 else None
+    rows = model.embed(
+        [texts[i] for i in order],
+        batch_size=batch_size or cfg.embed_batch_size,
+        parallel=parallel,
+    )
+    # Fill a preallocated (N, dim) block straight from the generator: no
+    # list of per-row arrays, no asarray copy, and the scatter back to
+    # input order happens in the same pass.
+    out = np.empty((len(texts), cfg.embedding_dim), dtype=np.float32)
+    for dst, vec in zip(order, rows, strict=True):
+        out[dst] = vec
+    norms = np.linalg.norm(out, axis=1, keepdims=True)
     norms[norms == 0.0] = 1.0
-    return arr / norms
+    out /= norms
+    return out
 
 
-def embed_query(query: str, cfg: Config) -> np.ndarray:
-    """Embed a single query string and return a 1-D float32 ndarray."""
-    model = _get_model(cfg.embedding_model)
+@lru_cache(maxsize=128)
+def _embed_query_cached(query: str, model_name: str, threads: int | None) -> np.ndarray:
+    model = _get_model(model_name, threads)
     vec = next(iter(model.query_embed([query])))
     arr = np.asarray(vec, dtype=np.float32)
     n = float(np.linalg.norm(arr))
-    return arr / n if n else arr
+    if n:
+        arr /= n
+    # Shared across cache hits -- freeze so no caller can corrupt it.
+    arr.setflags(write=False)
+    return arr
+
+
+def embed_query(query: str, cfg: Config) -> np.ndarray:
+    """Embed a single query string and return a 1-D float32 ndarray.
+
+    Repeat queries (chat follow-ups, re-running a search) are served from a
+    small LRU cache instead of another model forward pass. The returned
+    array is read-only.
+    """
+    return _embed_query_cached(query, cfg.embedding_model, cfg.embedding_threads)
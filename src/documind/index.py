@@ -14,9 +14,12 @@ chunks table (cheap and keeps IDF correct).
 from __future__ import annotations
 
 import json
+import os
 import shutil
 import sqlite3
+from collections import deque
 from collections.abc import Callable, Iterable
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
 
@@ -29,6 +32,9 @@ from .embeddings import embed_texts
 
 SCHEMA_VERSION = 1
 
+# Rows per table.add() call; bounds the Arrow materialization for huge ingests.
+_LANCE_WRITE_BATCH = 1024
+
 
 def _extract_table_names(db) -> set[str]:
     """Normalize the varied return types of `lancedb.Connection.list_tables`.
@@ -95,6 +101,7 @@ class IndexStats:
     new_files: int = 0
     changed_files: int = 0
     unchanged_files: int = 0
+    moved_files: int = 0
     removed_files: int = 0
     total_chunks: int = 0
     embedded_chunks: int = 0
@@ -112,6 +119,14 @@ class DocuMindIndex:
         self.bm25_path = self.index_dir / "bm25"
         self.state_path = self.index_dir / "state.json"
         self._conn: sqlite3.Connection | None = None
+        # Loaded BM25 retriever + chunk-id mapping, cached per instance so
+        # repeated queries (e.g. a chat session) don't reload it from disk.
+        # Keyed by the saved chunk_ids.json mtime so a rebuild by another
+        # process invalidates it with a single stat.
+        self._bm25_cache: tuple[int, object, list[str]] | None = None
+        # Open lance table handle; one connection per instance means every
+        # add/delete/search sees the same view.
+        self._lance_table = None
 
     # --------------------------------------------------------------- plumbing
 
@@ -123,6 +138,10 @@ class DocuMindIndex:
         if self._conn is None:
             self._ensure_dirs()
             self._conn = sqlite3.connect(self.meta_path)
+            # WAL + NORMAL: readers aren't blocked during index writes and
+            # fsync drops to one per checkpoint instead of per transaction.
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
             self._conn.executescript(_SCHEMA_SQL)
             self._conn.commit()
         return self._conn
@@ -131,6 +150,7 @@ class DocuMindIndex:
         if self._conn is not None:
             self._conn.close()
             self._conn = None
+        self._lance_table = None
 
     def exists(self) -> bool:
         return self.meta_path.exists() and self.lance_path.exists()
@@ -162,23 +182,31 @@ class DocuMindIndex:
     def _open_lance_table(self, create: bool = False):
         import lancedb
 
+        if self._lance_table is not None:
+            return self._lance_table
+
         db = lancedb.connect(str(self.lance_path))
         names = _extract_table_names(db)
         if "chunks" in names:
-            return db.open_table("chunks")
+            self._lance_table = db.open_table("chunks")
+            return self._lance_table
         if not create:
             return None
 
+        # Vectors are stored as float16: they are L2-normalized, so the
+        # ~1e-3 quantization error is far below ranking noise, and the
+        # on-disk footprint and scan bandwidth are halved.
         schema = pa.schema([
             pa.field("chunk_id", pa.string()),
             pa.field("file_hash", pa.string()),
             pa.field("rel_path", pa.string()),
             pa.field(
                 "vector",
-                pa.list_(pa.float32(), list_size=self.cfg.embedding_dim),
+                pa.list_(pa.float16(), list_size=self.cfg.embedding_dim),
             ),
         ])
-        return db.create_table("chunks", schema=schema)
+        self._lance_table = db.create_table("chunks", schema=schema)
+        return self._lance_table
 
     def _lance_delete_by_file_hash(self, file_hashes: Iterable[str]) -> None:
         hashes = [h for h in file_hashes if h]
@@ -194,22 +222,29 @@ class DocuMindIndex:
         if not chunks:
             return
         table = self._open_lance_table(create=True)
-        rows = pa.table({
-            "chunk_id": [c.chunk_id for c in chunks],
-            "file_hash": [c.file_hash for c in chunks],
-            "rel_path": [c.rel_path for c in chunks],
-            "vector": pa.array(
-                [v.tolist() for v in vectors],
-                type=pa.list_(pa.float32(), list_size=self.cfg.embedding_dim),
-            ),
-        })
-        table.add(rows)
+        # Match the table's stored dtype (float16 for new tables; float32
+        # tables written by older versions keep working until a rebuild).
+        value_type = table.schema.field("vector").type.value_type
+        dtype = np.float16 if value_type == pa.float16() else np.float32
+        cast = np.ascontiguousarray(vectors, dtype=dtype)
+        for lo in range(0, len(chunks), _LANCE_WRITE_BATCH):
+            hi = min(lo + _LANCE_WRITE_BATCH, len(chunks))
+            batch = chunks[lo:hi]
+            rows = pa.table({
+                "chunk_id": [c.chunk_id for c in batch],
+                "file_hash": [c.file_hash for c in batch],
+                "rel_path": [c.rel_path for c in batch],
+                "vector": pa.FixedSizeListArray.from_arrays(
+                    pa.array(cast[lo:hi].reshape(-1)), self.cfg.embedding_dim
+                ),
+            })
+            table.add(rows)
 
     # ---------------------------------------------------------------- SQLite
 
-    def _get_known_files(self) -> dict[str, tuple[str, float]]:
-        cur = self.conn.execute("SELECT rel_path, file_hash, mtime FROM files")
-        return {row[0]: (row[1], row[2]) for row in cur.fetchall()}
+    def _get_known_files(self) -> dict[str, tuple[str, float, int]]:
+        cur = self.conn.execute("SELECT rel_path, file_hash, mtime, size FROM files")
+        return {row[0]: (row[1], row[2], row[3]) for row in cur.fetchall()}
 
     def _upsert_file_record(self, rec: FileRecord) -> None:
         self.conn.execute(
@@ -221,13 +256,22 @@ class DocuMindIndex:
     def _delete_file_rows(self, rel_paths: Iterable[str]) -> list[str]:
         """Delete rows for given rel_paths. Returns affected file_hashes."""
         hashes: list[str] = []
-        for rel in rel_paths:
-            cur = self.conn.execute("SELECT file_hash FROM files WHERE rel_path = ?", (rel,))
-            row = cur.fetchone()
-            if row:
-                hashes.append(row[0])
-            self.conn.execute("DELETE FROM chunks WHERE rel_path = ?", (rel,))
-            self.conn.execute("DELETE FROM files  WHERE rel_path = ?", (rel,))
+        rels = list(rel_paths)
+        # Set-based statements instead of three per file; sliced to stay
+        # under SQLite's bound-parameter limit on big purges.
+        for lo in range(0, len(rels), 500):
+            batch = rels[lo:lo + 500]
+            placeholders = ",".join("?" for _ in batch)
+            cur = self.conn.execute(
+                f"SELECT file_hash FROM files WHERE rel_path IN ({placeholders})", batch
+            )
+            hashes.extend(row[0] for row in cur.fetchall())
+            self.conn.execute(
+                f"DELETE FROM chunks WHERE rel_path IN ({placeholders})", batch
+            )
+            self.conn.execute(
+                f"DELETE FROM files WHERE rel_path IN ({placeholders})", batch
+            )
         return hashes
 
     def _insert_chunks(self, chunks: list[Chunk]) -> None:
@@ -244,8 +288,12 @@ class DocuMindIndex:
             ],
         )
 
+    def chunk_count(self) -> int:
+        """Number of indexed chunks, counted in SQLite without loading rows."""
+        return self.conn.execute("SELECT COUNT(*) FROM chunks").fetchone()[0]
+
     def all_chunks(self) -> list[dict]:
-        """Return all chunks as dicts; used by search + BM25 rebuild."""
+        """Return all chunks as dicts, ordered by file and position."""
         cur = self.conn.execute(
             "SELECT chunk_id, rel_path, file_hash, language, start_line, end_line, text "
             "FROM chunks ORDER BY rel_path, start_line"
@@ -272,16 +320,21 @@ class DocuMindIndex:
         """Rebuild BM25 from the current chunks table. Returns doc count."""
         import bm25s
 
-        rows = self.conn.execute(
+        self._bm25_cache = None
+        # Stream rows off the cursor instead of fetchall(): the id and text
+        # lists are needed either way, but the intermediate list of row
+        # tuples over the whole corpus is not.
+        ids: list[str] = []
+        texts: list[str] = []
+        for cid, text in self.conn.execute(
             "SELECT chunk_id, text FROM chunks ORDER BY chunk_id"
-        ).fetchall()
-        if not rows:
+        ):
+            ids.append(cid)
+            texts.append(text)
+        if not ids:
             if self.bm25_path.exists():
                 shutil.rmtree(self.bm25_path, ignore_errors=True)
             return 0
-
-        ids = [r[0] for r in rows]
-        texts = [r[1] for r in rows]
         tokens = bm25s.tokenize(
             texts, stopwords="en", stemmer=None, show_progress=False
         )
@@ -296,17 +349,31 @@ class DocuMindIndex:
             shutil.rmtree(self.bm25_path, ignore_errors=True)
         self.bm25_path.mkdir(parents=True, exist_ok=True)
         retriever.save(str(self.bm25_path))
-        (self.bm25_path / "chunk_ids.json").write_text(json.dumps(ids), encoding="utf-8")
+        ids_path = self.bm25_path / "chunk_ids.json"
+        ids_path.write_text(json.dumps(ids), encoding="utf-8")
+        self._bm25_cache = (ids_path.stat().st_mtime_ns, retriever, ids)
         return len(ids)
 
     def load_bm25(self):
-        """Load saved BM25 retriever + chunk id mapping. Returns (retriever, ids)."""
+        """Load saved BM25 retriever + chunk id mapping. Returns (retriever, ids).
+
+        The loaded pair is cached on the instance, validated against the
+        saved chunk_ids.json mtime: a cache hit costs one stat, and an index
+        rebuilt by another process is picked up automatically.
+        """
         import bm25s
 
-        if not (self.bm25_path / "chunk_ids.json").exists():
+        ids_path = self.bm25_path / "chunk_ids.json"
+        try:
+            mtime_ns = ids_path.stat().st_mtime_ns
+        except OSError:
+            self._bm25_cache = None
             return None, []
-        ids = json.loads((self.bm25_path / "chunk_ids.json").read_text(encoding="utf-8"))
+        if self._bm25_cache is not None and self._bm25_cache[0] == mtime_ns:
+            return self._bm25_cache[1], self._bm25_cache[2]
+        ids = json.loads(ids_path.read_text(encoding="utf-8"))
         retriever = bm25s.BM25.load(str(self.bm25_path))
+        self._bm25_cache = (mtime_ns, retriever, ids)
         return retriever, ids
 
     # -------------------------------------------------------------- build
@@ -326,10 +393,11 @@ class DocuMindIndex:
         self._ensure_dirs()
         stats = IndexStats()
 
-        # 1) Scan
-        records = scan_files(self.project_root, self.cfg)
-        stats.scanned_files = len(records)
+        # 1) Scan. Passing the known-files map lets the scanner skip
+        # reading/hashing files whose mtime+size are unchanged.
         known = self._get_known_files()
+        records = scan_files(self.project_root, self.cfg, known=known)
+        stats.scanned_files = len(records)
 
         new_or_changed: list[FileRecord] = []
         removed: list[str] = []
@@ -349,43 +417,130 @@ class DocuMindIndex:
             else:
                 stats.unchanged_files += 1
 
+        # 1b) Detect moves: a "new" file whose content hash matches a file
+        # that just disappeared adopts its chunks and vectors wholesale
+        # (chunk ids are hash-based, so they stay valid). Renames then cost
+        # two SQL statements instead of a re-embed.
+        moved: list[tuple[str, FileRecord]] = []
+        if removed and new_or_changed:
+            removed_by_hash = {known[rel][0]: rel for rel in removed}
+            remaining: list[FileRecord] = []
+            for rec in new_or_changed:
+                old_rel = None
+                if rec.rel_path not in known:
+                    old_rel = removed_by_hash.pop(rec.file_hash, None)
+                if old_rel is None:
+                    remaining.append(rec)
+                else:
+                    moved.append((old_rel, rec))
+            if moved:
+                new_or_changed = remaining
+                adopted = {old for old, _ in moved}
+                removed = [rel for rel in removed if rel not in adopted]
+                stats.new_files -= len(moved)
+                stats.moved_files = len(moved)
+
         stats.removed_files = len(removed)
 
-        # 2) Remove stale rows/vectors
+        # 2) Remove stale rows/vectors; re-point rows for moved files
         to_purge_paths = removed + [r.rel_path for r in new_or_changed]
         stale_hashes = self._delete_file_rows(to_purge_paths)
         self._lance_delete_by_file_hash(stale_hashes)
 
-        # 3) Chunk + embed new/changed files
-        all_new_chunks: list[Chunk] = []
-        for idx, rec in enumerate(new_or_changed):
-            if progress:
-                progress("chunking", idx, len(new_or_changed))
-            chunks = chunks_for_file(rec, self.cfg)
-            all_new_chunks.extend(chunks)
+        for old_rel, rec in moved:
+            self.conn.execute(
+                "UPDATE chunks SET rel_path = ? WHERE rel_path = ?",
+                (rec.rel_path, old_rel),
+            )
+            self.conn.execute("DELETE FROM files WHERE rel_path = ?", (old_rel,))
             self._upsert_file_record(rec)
 
-        stats.embedded_chunks = len(all_new_chunks)
-
-        if all_new_chunks:
-            if progress:
-                progress("embedding", 0, len(all_new_chunks))
-            vectors = embed_texts([c.text for c in all_new_chunks], self.cfg)
+        # 3) Chunk + embed new/changed files in a streamed pipeline: batches
+        # of chunks are embedded and written out while later files are still
+        # being chunked, so chunks and vectors never all sit in memory at once.
+        # Flush in multiples of the encode batch so embed_texts can engage
+        # its multi-process path on big ingests; memory stays bounded.
+        flush_size = max(self.cfg.embed_batch_size * 4, 1)
+        pending: list[Chunk] = []
+        total_chunked = 0
+        # Lance writes happen on a single background thread so the next
+        # batch embeds while the previous one is being written; at most two
+        # writes may be queued (sqlite stays on this thread -- the
+        # connection is not shareable across threads).
+        lance_writes: deque = deque()
+
+        def _flush_pending(writer: ThreadPoolExecutor) -> None:
+            if not pending:
+                return
+            # Identical chunk texts (license headers, vendored copies, repeated
+            # boilerplate) are embedded once and their rows fanned back out.
+            texts = [c.text for c in pending]
+            unique: dict[str, int] = {}
+            for t in texts:
+                unique.setdefault(t, len(unique))
+            if len(unique) < len(texts):
+                uvecs = embed_texts(list(unique), self.cfg)
+                vectors = uvecs[[unique[t] for t in texts]]
+            else:
+                vectors = embed_texts(texts, self.cfg)
+            self._insert_chunks(pending)
+            batch = pending[:]
+            pending.clear()
+            while len(lance_writes) >= 2:
+                lance_writes.popleft().result()
+            lance_writes.append(writer.submit(self._lance_add, batch, vectors))
+            stats.embedded_chunks += len(batch)
             if progress:
-                progress("embedding", len(all_new_chunks), len(all_new_chunks))
-
-            self._insert_chunks(all_new_chunks)
-            self._lance_add(all_new_chunks, vectors)
+                progress("embedding", stats.embedded_chunks, total_chunked)
+
+        # Files are chunked by a thread pool (reads and PDF parsing overlap)
+        # with a bounded submit window, so results stay in walk order and
+        # read-ahead can't outrun the flushes above.
+        workers = min(8, os.cpu_count() or 1)
+        with (
+            ThreadPoolExecutor(max_workers=workers) as ex,
+            ThreadPoolExecutor(max_workers=1) as writer,
+        ):
+            todo = iter(new_or_changed)
+            window: deque = deque()
+            for rec in todo:
+                window.append((rec, ex.submit(chunks_for_file, rec, self.cfg)))
+                if len(window) >= workers * 2:
+                    break
+            done = 0
+            while window:
+                rec, fut = window.popleft()
+                chunks = fut.result()
+                nxt = next(todo, None)
+                if nxt is not None:
+                    window.append((nxt, ex.submit(chunks_for_file, nxt, self.cfg)))
+                if progress:
+                    progress("chunking", done, len(new_or_changed))
+                done += 1
+                total_chunked += len(chunks)
+                pending.extend(chunks)
+                rec.text = None  # chunked; release the scan-time content
+                self._upsert_file_record(rec)
+                if len(pending) >= flush_size:
+                    _flush_pending(writer)
+            _flush_pending(writer)
+            while lance_writes:
+                lance_writes.popleft().result()
 
         self.conn.commit()
 
-        # 4) Rebuild BM25 from final state
-        if progress:
-            progress("bm25", 0, 1)
-        total = self.rebuild_bm25()
-        stats.total_chunks = total
-        if progress:
-            progress("bm25", 1, 1)
+        # 4) Rebuild BM25 from final state. A no-op pass (and pure moves,
+        # which keep chunk ids and texts intact) leaves the saved retriever
+        # exact, so don't tear it down and re-tokenize the whole corpus.
+        dirty = bool(new_or_changed or removed)
+        if dirty or not (self.bm25_path / "chunk_ids.json").exists():
+            if progress:
+                progress("bm25", 0, 1)
+            stats.total_chunks = self.rebuild_bm25()
+            if progress:
+                progress("bm25", 1, 1)
+        else:
+            stats.total_chunks = self.chunk_count()
 
         self._write_state()
         return stats
@@ -395,5 +550,6 @@ class DocuMindIndex:
     def destroy(self) -> None:
         """Remove the entire `.documind/` directory for this project."""
         self.close()
+        self._bm25_cache = None
         if self.index_dir.exists():
             shutil.rmtree(self.index_dir, ignore_errors=True)
@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 from collections.abc import Iterator
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 from .config import Config
 
@@ -17,15 +17,21 @@ class OllamaClient:
     """Thin synchronous wrapper around `ollama` with streaming support."""
 
     cfg: Config
+    _client_obj: object | None = field(default=None, init=False, repr=False)
 
     def _client(self):
-        try:
-            from ollama import Client
-        except ImportError as exc:  # pragma: no cover
-            raise LLMError(
-                "The `ollama` python package is required. Install with: pip install ollama"
-            ) from exc
-        return Client(host=self.cfg.ollama_base_url)
+        # Built once per instance: the underlying httpx client keeps its
+        # connection pool, so ping/list/chat reuse one TCP session instead
+        # of handshaking per call.
+        if self._client_obj is None:
+            try:
+                from ollama import Client
+            except ImportError as exc:  # pragma: no cover
+                raise LLMError(
+                    "The `ollama` python package is required. Install with: pip install ollama"
+                ) from exc
+            self._client_obj = Client(host=self.cfg.ollama_base_url)
+        return self._client_obj
 
     def ping(self) -> bool:
         """Return True if the Ollama daemon responds."""
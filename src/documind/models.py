@@ -55,8 +55,10 @@ MODEL_TIERS: tuple[ModelSpec, ...] = (
 TIER_ORDER = ("tiny", "small", "deep")
 
 
-def _by_tier() -> dict[str, ModelSpec]:
-    return {m.tier: m for m in MODEL_TIERS}
+# Tiers are fixed at import time; build the lookup tables once instead of
+# per tier_info call.
+_BY_TIER: dict[str, ModelSpec] = {m.tier: m for m in MODEL_TIERS}
+_TIER_ALIASES = {"medium": "deep", "large": "deep"}
 
 
 def tier_info(tier: str) -> ModelSpec:
@@ -66,10 +68,9 @@ def tier_info(tier: str) -> ModelSpec:
     so that configs written by DocuMind 2.1.0 still resolve.
     """
     key = tier.strip().lower()
-    aliases = {"medium": "deep", "large": "deep"}
-    key = aliases.get(key, key)
+    key = _TIER_ALIASES.get(key, key)
     try:
-        return _by_tier()[key]
+        return _BY_TIER[key]
     except KeyError as exc:
         valid = ", ".join(TIER_ORDER)
         raise ValueError(f"Unknown tier {tier!r}. Choose one of: {valid}") from exc
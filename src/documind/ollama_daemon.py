@@ -32,18 +32,20 @@ class DaemonStatus:
     how: str  # "already" | "brew" | "systemctl" | "spawn" | "failed" | "missing"
 
 
-def _ping(cfg: Config) -> bool:
-    return OllamaClient(cfg).ping()
+def _poll_until_up(
+    client: OllamaClient, *, timeout_s: float = 6.0, interval_s: float = 0.25
+) -> bool:
+    """Poll `ping()` until it returns True or the timeout elapses.
 
-
-def _poll_until_up(cfg: Config, *, timeout_s: float = 6.0, interval_s: float = 0.25) -> bool:
-    """Poll `ping()` until it returns True or the timeout elapses."""
+    Takes the caller's client so every poll reuses one connection pool
+    instead of handshaking a fresh HTTP client per attempt.
+    """
     deadline = time.monotonic() + timeout_s
     while time.monotonic() < deadline:
-        if _ping(cfg):
+        if client.ping():
             return True
         time.sleep(interval_s)
-    return _ping(cfg)
+    return client.ping()
 
 
 def _run_silent(cmd: list[str], timeout_s: float = 10.0) -> bool:
@@ -96,7 +98,8 @@ def ensure_daemon_running(cfg: Config) -> DaemonStatus:
     Non-interactive: no prompts, no stdin reads. Callers that want a
     confirmation prompt should do that themselves and then call this.
     """
-    if _ping(cfg):
+    client = OllamaClient(cfg)
+    if client.ping():
         return DaemonStatus(True, "already")
 
     if not shutil.which("ollama"):
@@ -104,13 +107,13 @@ def ensure_daemon_running(cfg: Config) -> DaemonStatus:
 
     system = platform.system()
 
-    if system == "Darwin" and _try_brew_service() and _poll_until_up(cfg):
+    if system == "Darwin" and _try_brew_service() and _poll_until_up(client):
         return DaemonStatus(True, "brew")
 
-    if system == "Linux" and _try_systemctl_user() and _poll_until_up(cfg):
+    if system == "Linux" and _try_systemctl_user() and _poll_until_up(client):
         return DaemonStatus(True, "systemctl")
 
-    if _spawn_detached_serve() and _poll_until_up(cfg):
+    if _spawn_detached_serve() and _poll_until_up(client):
         return DaemonStatus(True, "spawn")
 
     return DaemonStatus(False, "failed")
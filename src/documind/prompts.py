@@ -29,9 +29,14 @@ Answer the question using only the context above. Cite files like \
 `path/to/file.py:12-34` when referring to code."""
 
 
+# The system turn never varies, so every call shares one dict. Treat it as
+# read-only: callers get a fresh list but not fresh message dicts.
+_SYSTEM_MESSAGE = {"role": "system", "content": SYSTEM_PROMPT}
+
+
 def build_messages(query: str, context: str) -> list[dict]:
     """Build Ollama-style chat messages for a grounded RAG answer."""
     return [
-        {"role": "system", "content": SYSTEM_PROMPT},
+        _SYSTEM_MESSAGE,
         {"role": "user", "content": USER_TEMPLATE.format(query=query, context=context)},
     ]
@@ -2,8 +2,11 @@
 
 from __future__ import annotations
 
+import contextlib
 import re
+import weakref
 from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 
 import numpy as np
@@ -14,6 +17,14 @@ from .index import DocuMindIndex
 
 _TOKEN_RE = re.compile(r"[A-Za-z_][A-Za-z0-9_]{1,}")
 
+# Resolved once at import; expansion degrades to a no-op when the optional
+# dependency is missing instead of re-attempting the import per query.
+try:
+    from rapidfuzz import fuzz as _fuzz
+    from rapidfuzz import process as _rf_process
+except ImportError:  # pragma: no cover - optional dependency
+    _fuzz = _rf_process = None
+
 
 @dataclass
 class SearchHit:
@@ -48,9 +59,7 @@ def _expand_query_fuzzy(
     Handles typos like "ingesion" -> "ingestion" by pulling the closest
     vocabulary terms via rapidfuzz and OR'ing them into the BM25 query.
     """
-    try:
-        from rapidfuzz import fuzz, process
-    except ImportError:
+    if _rf_process is None:
         return query
 
     terms = _tokenize(query)
@@ -58,20 +67,28 @@ def _expand_query_fuzzy(
         return query
 
     vocab_set = set(vocab)
+    oov = list(dict.fromkeys(t for t in terms if t not in vocab_set))
+    if not oov:
+        return query
+
+    # One cdist call scores every (term, vocab) pair in C; entries below the
+    # cutoff come back as 0, so top candidates fall out of an argpartition
+    # per row instead of a full process.extract scan per term.
+    scores = _rf_process.cdist(
+        oov,
+        vocab,
+        scorer=_fuzz.WRatio,
+        score_cutoff=cfg.fuzzy_threshold,
+        workers=-1,
+    )
+    limit = cfg.fuzzy_expand_per_term
     additions: list[str] = []
-    for term in terms:
-        if term in vocab_set:
-            continue
-        matches = process.extract(
-            term,
-            vocab,
-            scorer=fuzz.WRatio,
-            limit=cfg.fuzzy_expand_per_term,
-            score_cutoff=cfg.fuzzy_threshold,
-        )
-        for cand, _score, _idx in matches:
-            if cand != term:
-                additions.append(cand)
+    for row in scores:
+        hits = np.nonzero(row)[0]
+        if len(hits) > limit:
+            hits = hits[np.argpartition(row[hits], -limit)[-limit:]]
+        for j in sorted(hits, key=lambda j: row[j], reverse=True):
+            additions.append(vocab[j])
 
     if not additions:
         return query
@@ -101,17 +118,30 @@ def _rrf_merge(
     return [(cid, score, per_source_ranks[cid]) for cid, score in sorted_ids]
 
 
+# Vocab list per retriever: the retriever is itself cached for the life of a
+# session, so fuzzy expansion shouldn't rebuild a 100k-token list per query.
+_vocab_cache: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+
+
 def _vocab_from_bm25(retriever) -> list[str]:
     """Extract the bm25s vocabulary (list of tokens) for fuzzy expansion."""
+    cached = _vocab_cache.get(retriever)
+    if cached is not None:
+        return cached
+
+    vocab: list[str] = []
     vocab_attr = getattr(retriever, "vocab_dict", None)
     if isinstance(vocab_attr, dict):
-        return list(vocab_attr.keys())
-    vocab_attr = getattr(retriever, "vocabulary", None)
-    if isinstance(vocab_attr, dict):
-        return list(vocab_attr.keys())
-    if isinstance(vocab_attr, list):
-        return list(vocab_attr)
-    return []
+        vocab = list(vocab_attr.keys())
+    else:
+        vocab_attr = getattr(retriever, "vocabulary", None)
+        if isinstance(vocab_attr, dict):
+            vocab = list(vocab_attr.keys())
+        elif isinstance(vocab_attr, list):
+            vocab = list(vocab_attr)
+    with contextlib.suppress(TypeError):  # type may not support weak references
+        _vocab_cache[retriever] = vocab
+    return vocab
 
 
 # ------------------------------------------------------------------ searches
@@ -168,8 +198,10 @@ def _vector_search(
         return []
 
     try:
+        # lancedb takes the ndarray as-is; a .tolist() round-trip would box
+        # every float into a Python object first.
         df = (
-            table.search(qvec.tolist())
+            table.search(qvec)
             .limit(limit)
             .select(["chunk_id", "_distance"])
             .to_list()
@@ -192,8 +224,13 @@ def search(
     k = top_k or cfg.top_k
     pool = max(k * 4, 20)
 
-    bm25_ids = _bm25_search(idx, query, cfg, pool)
-    vec_ids = _vector_search(idx, query, cfg, pool)
+    # The two retrievers are independent until the RRF merge, and both spend
+    # their time outside the GIL (scipy sparse ops / ONNX inference), so run
+    # them side by side. _get_model's lock keeps the first-load safe.
+    with ThreadPoolExecutor(max_workers=2) as ex:
+        bm25_future = ex.submit(_bm25_search, idx, query, cfg, pool)
+        vec_ids = _vector_search(idx, query, cfg, pool)
+        bm25_ids = bm25_future.result()
 
     if not bm25_ids and not vec_ids:
         return []
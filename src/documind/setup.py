@@ -54,11 +54,14 @@ def scan_project(root: Path, cfg: Config | None = None) -> ProjectStats:
     cfg = cfg or load_config()
     files = 0
     total_loc = 0
-    for path in iter_source_files(root.resolve(), cfg.max_file_bytes):
+    for path in iter_source_files(root, cfg.max_file_bytes, (cfg.index_dir_name,)):
         files += 1
         try:
+            # Count newlines in fixed-size blocks: bytes.count is a memchr
+            # scan, and no line objects are ever materialized.
             with path.open("rb") as f:
-                total_loc += sum(1 for _ in f)
+                while block := f.read(65536):
+                    total_loc += block.count(b"\n")
         except OSError:
             continue
     return ProjectStats(file_count=files, total_loc=total_loc)
@@ -49,3 +49,23 @@ def test_htmlcov_and_coverage_are_excluded(tmp_path: Path) -> None:
         "node_modules/leftpad/index.js",
     }
     assert forbidden.isdisjoint(picked), f"unexpected files got through: {forbidden & set(picked)}"
+
+
+def test_gitignore_simple_names_are_pruned(tmp_path: Path) -> None:
+    cfg = load_config()
+
+    _write(
+        tmp_path / ".gitignore",
+        "# generated stuff\ngenerated/\ndatasets\nscratch.md\n*.tmp\n!important.py\n",
+    )
+    _write(tmp_path / "app.py", "def hello():\n    return 'hi'\n")
+    _write(tmp_path / "scratch.md", "# scratch")
+    _write(tmp_path / "generated" / "schema.sql", "SELECT 1;")
+    _write(tmp_path / "datasets" / "notes.md", "# data")
+
+    picked = sorted(
+        p.relative_to(tmp_path).as_posix()
+        for p in iter_source_files(tmp_path, cfg.max_file_bytes)
+    )
+
+    assert picked == ["app.py"]
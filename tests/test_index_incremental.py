@@ -0,0 +1,82 @@
+"""Incremental-index behaviors that don't need a real embedding model.
+
+`embed_texts` is stubbed with a deterministic fake so these run fully
+offline; everything else (sqlite, lance, bm25) is exercised for real.
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+import documind.index as index_mod
+from documind.config import load_config
+from documind.index import DocuMindIndex
+
+
+@pytest.fixture()
+def fake_embed(monkeypatch):
+    """Replace embed_texts with a counter-equipped stub."""
+    calls: list[int] = []
+
+    def _embed(texts, cfg, batch_size=None):
+        texts = list(texts)
+        calls.append(len(texts))
+        return np.ones((len(texts), cfg.embedding_dim), dtype=np.float32)
+
+    monkeypatch.setattr(index_mod, "embed_texts", _embed)
+    return calls
+
+
+def _write(path: Path, body: str) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(body, encoding="utf-8")
+
+
+def test_rename_reuses_chunks_without_reembedding(tmp_path: Path, fake_embed) -> None:
+    cfg = load_config()
+    _write(tmp_path / "alpha.py", "def alpha():\n    return 1\n")
+    _write(tmp_path / "beta.py", "def beta():\n    return 2\n")
+
+    idx = DocuMindIndex(tmp_path, cfg)
+    stats = idx.build_or_update()
+    assert stats.new_files == 2
+    assert stats.embedded_chunks > 0
+    embeds_after_build = sum(fake_embed)
+
+    # Rename one file; content (and thus hash) is unchanged.
+    (tmp_path / "alpha.py").rename(tmp_path / "renamed_alpha.py")
+
+    stats = idx.build_or_update()
+    assert stats.moved_files == 1
+    assert stats.removed_files == 0
+    assert stats.embedded_chunks == 0
+    assert sum(fake_embed) == embeds_after_build  # no new embedding work
+
+    rel_paths = {c["rel_path"] for c in idx.all_chunks()}
+    assert "renamed_alpha.py" in rel_paths
+    assert "alpha.py" not in rel_paths
+    idx.close()
+
+
+def test_noop_reindex_skips_bm25_rebuild(tmp_path: Path, fake_embed, monkeypatch) -> None:
+    cfg = load_config()
+    _write(tmp_path / "app.py", "def handler():\n    return 'ok'\n")
+
+    idx = DocuMindIndex(tmp_path, cfg)
+    first = idx.build_or_update()
+    assert first.total_chunks > 0
+
+    rebuilds: list[int] = []
+    original = idx.rebuild_bm25
+    monkeypatch.setattr(
+        idx, "rebuild_bm25", lambda: (rebuilds.append(1), original())[1]
+    )
+
+    second = idx.build_or_update()
+    assert second.unchanged_files == 1
+    assert second.total_chunks == first.total_chunks
+    assert rebuilds == []  # nothing changed, retriever left untouched
+    idx.close()